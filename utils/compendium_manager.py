@@ -1,92 +1,139 @@
+import os
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import OrderedDict
-from copy import deepcopy
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ------------- Config -------------
-KEEP_KEYS = {"label", "_id", "name", "tokenName", "description", "notes"}
+KEEP_KEYS = frozenset({"label", "_id", "name", "tokenName", "description", "notes"})
 TRANSLATABLE_KEYS = KEEP_KEYS
 REDUCED_SUFFIX = ".reduced.json"
+STAMP_SUFFIX = ".stamp"
 
-TOP_LEVEL_KEYS_ORDER = ["label", "mapping", "folders", "entries"]
-KEYS_TO_SORT_IMMEDIATELY = {"folders", "entries"}
-JSON_GLOB = "*.json"
+TOP_LEVEL_KEYS_ORDER = ("label", "mapping", "folders", "entries")
+KEYS_TO_SORT_IMMEDIATELY = frozenset({"folders", "entries"})
+JSON_SUFFIX = ".json"
 # ----------------------------------
 
 # -------- Reduce helpers ----------
-def clean_entry(obj):
-    """Reduce each entry recursively: keep only the keys in KEEP_KEYS."""
-    if isinstance(obj, dict):
-        new_obj = {}
+def has_translatable_keys(item: Dict[str, Any]) -> bool:
+    """Return True if the dict ITEM has any translatable key other than '_id'."""
+    return any((k in item and k != "_id") for k in KEEP_KEYS)
+
+def clean_entry(obj: Any) -> Tuple[Any, bool]:
+    """
+    Reduce each entry recursively: keep only the keys in KEEP_KEYS.
+    Returns (cleaned, translatable), where translatable tells whether OBJ
+    holds any list of dicts with translatable keys. cleaned is always a
+    dict, a list or None, so plain truthiness tells if it is worth keeping.
+    """
+    _isinstance, _dict, _list, _KK = isinstance, dict, list, KEEP_KEYS
+    if _isinstance(obj, _dict):
+        new_obj: Dict[str, Any] = {}
+        translatable = False
         for k, v in obj.items():
-            if k in KEEP_KEYS:
+            if k in _KK:
                 new_obj[k] = v
-            elif isinstance(v, (dict, list)):
-                cleaned = clean_entry(v)
-                if cleaned not in (None, {}, []):
+                if not translatable and _isinstance(v, (_dict, _list)):
+                    translatable = scan_flags(v)[1]
+            elif _isinstance(v, (_dict, _list)):
+                cleaned, found = clean_entry(v)
+                translatable = translatable or found
+                if cleaned:
                     new_obj[k] = cleaned
-        return new_obj
-    elif isinstance(obj, list):
-        cleaned_list = [clean_entry(i) for i in obj]
-        return [i for i in cleaned_list if i not in (None, {}, [])]
+        return new_obj, translatable
+    elif _isinstance(obj, _list):
+        cleaned_list = []
+        translatable = False
+        for i in obj:
+            cleaned, found = clean_entry(i)
+            if cleaned:
+                cleaned_list.append(cleaned)
+            if _isinstance(i, _dict):
+                translatable = translatable or found or has_translatable_keys(i)
+        return cleaned_list, translatable
     else:
-        return None
+        return None, False
+
+def scan_flags(data: Any) -> Tuple[bool, bool]:
+    """
+    Gather the reduce gates for a subtree that is kept as-is, walking it
+    with an explicit stack instead of recursion.
+    Returns (has_entries, has_translatable) with the same meaning as in
+    reduce_and_check; items of nested lists are not checked for
+    translatable keys.
+    """
+    has_entries = has_translatable = False
+    stack = [(data, True)]
+    while stack and not (has_entries and has_translatable):
+        node, check_translatable = stack.pop()
+        if isinstance(node, dict):
+            e = node.get("entries")
+            if isinstance(e, dict) and e:
+                has_entries = True
+            stack.extend((v, check_translatable) for v in node.values())
+        elif isinstance(node, list):
+            for item in node:
+                if isinstance(item, dict):
+                    if check_translatable and not has_translatable:
+                        has_translatable = has_translatable_keys(item)
+                    stack.append((item, check_translatable))
+                else:
+                    stack.append((item, False))
+    return has_entries, has_translatable
 
-def reduce_entries(data):
-    """Apply reduction only inside 'entries' while preserving outer structure."""
+def reduce_and_check(data: Any) -> Tuple[Any, bool, bool, bool]:
+    """
+    Apply reduction only inside 'entries' while preserving outer structure,
+    in a single pass that also gathers the reduce gates.
+    Returns (reduced, changed, has_entries, has_translatable):
+    - changed: the reduced tree differs from DATA.
+    - has_entries: there is a non-empty 'entries' dictionary anywhere.
+    - has_translatable: there is a list of dicts with translatable keys.
+    """
+    if isinstance(data, list):
+        return (data, False) + scan_flags(data)
     if not isinstance(data, dict):
-        return data
-    result = {}
+        return data, False, False, False
+
+    result: Dict[str, Any] = {}
+    changed = has_entries = has_translatable = False
     for k, v in data.items():
         if k == "entries" and isinstance(v, dict):
-            result[k] = {ek: clean_entry(ev) for ek, ev in v.items()}
+            has_entries = has_entries or len(v) > 0
+            reduced_entries: Dict[str, Any] = {}
+            for ek, ev in v.items():
+                cleaned, found = clean_entry(ev)
+                reduced_entries[ek] = cleaned
+                changed = changed or cleaned != ev
+                has_translatable = has_translatable or found
+            result[k] = reduced_entries
         elif isinstance(v, (dict, list)):
-            result[k] = reduce_entries(v)
+            result[k], c, e, t = reduce_and_check(v)
+            changed = changed or c
+            has_entries = has_entries or e
+            has_translatable = has_translatable or t
         else:
             result[k] = v
-    return result
-
-def has_reduction(original, reduced):
-    """Check if reduced differs from the original."""
-    return json.dumps(original, sort_keys=True, ensure_ascii=False) != json.dumps(reduced, sort_keys=True, ensure_ascii=False)
-
-def has_entries_nonempty(data):
-    """Return True if there is a non-empty 'entries' dictionary anywhere."""
-    if isinstance(data, dict):
-        if isinstance(data.get("entries"), dict) and len(data["entries"]) > 0:
-            return True
-        return any(has_entries_nonempty(v) for v in data.values())
-    if isinstance(data, list):
-        return any(has_entries_nonempty(i) for i in data)
-    return False
-
-def has_translatable_list(data):
-    """Return True if there is any list of dicts with keys that are translatable."""
-    if isinstance(data, dict):
-        for v in data.values():
-            if has_translatable_list(v):
-                return True
-    elif isinstance(data, list):
-        for item in data:
-            if isinstance(item, dict):
-                if any((k in item and k != "_id") for k in KEEP_KEYS):
-                    return True
-                if has_translatable_list(item):
-                    return True
-    return False
+    return result, changed, has_entries, has_translatable
 # ----------------------------------
 
 # -------- Merge helpers -----------
 def copy_string_fields(dst, src):
     """Copy only string fields from SRC into DST, limited to TRANSLATABLE_KEYS."""
-    if not (isinstance(dst, dict) and isinstance(src, dict)):
+    _isinstance, _dict, _str, _TK = isinstance, dict, str, TRANSLATABLE_KEYS
+    if not (_isinstance(dst, _dict) and _isinstance(src, _dict)):
         return
     for k, v in src.items():
         if k == "_id":
             continue
-        if isinstance(v, str) and k in TRANSLATABLE_KEYS:
+        if _isinstance(v, _str) and k in _TK:
             dst[k] = v
 
 def merge_translations(dst, src):
@@ -95,50 +142,85 @@ def merge_translations(dst, src):
     - Copies only string fields defined in TRANSLATABLE_KEYS (excluding '_id').
     - Recursively merges nested dicts and lists.
     - Merges lists by _id, then by name, then by index as fallback.
-    - Cross-merges lists across keys within the same node.
+    - Cross-merges lists stored under different keys of the same node when
+      they share any '_id' or 'name', matching items by identity only
+      (same-key lists are merged above).
     """
-    if not (isinstance(dst, dict) and isinstance(src, dict)):
+    _isinstance, _dict, _list = isinstance, dict, list
+    if not (_isinstance(dst, _dict) and _isinstance(src, _dict)):
         return
 
     copy_string_fields(dst, src)
 
     for k, v in list(dst.items()):
         sv = src.get(k)
-        if isinstance(v, dict) and isinstance(sv, dict):
+        if _isinstance(v, _dict) and _isinstance(sv, _dict):
             merge_translations(v, sv)
-        elif isinstance(v, list) and isinstance(sv, list):
+        elif _isinstance(v, _list) and _isinstance(sv, _list):
             merge_lists(v, sv)
 
-    dst_lists = [v for v in dst.values() if isinstance(v, list)]
-    src_lists = [v for v in src.values() if isinstance(v, list)]
-    for dl in dst_lists:
-        for sl in src_lists:
-            if dl is not sl:
-                merge_lists(dl, sl)
-
-def merge_lists(dst_list, src_list):
+    src_lists = [(sk, v, list_identity_keys(v)) for sk, v in src.items() if _isinstance(v, _list)]
+    if not src_lists:
+        return
+    for dk, dl in dst.items():
+        if not _isinstance(dl, _list):
+            continue
+        dl_keys = None
+        for sk, sl, sl_keys in src_lists:
+            if sk == dk:
+                continue
+            if dl_keys is None:
+                dl_keys = list_identity_keys(dl)
+            if not dl_keys.isdisjoint(sl_keys):
+                merge_lists(dl, sl, by_index=False)
+                dl_keys = None  # the merge may have renamed items in dl
+
+def list_identity_keys(items):
+    """Return the set of string '_id' and 'name' values of the dicts in ITEMS."""
+    keys = set()
+    for it in items:
+        if isinstance(it, dict):
+            sid = it.get("_id")
+            if isinstance(sid, str):
+                keys.add(sid)
+            nm = it.get("name")
+            if isinstance(nm, str):
+                keys.add(nm)
+    return keys
+
+def merge_lists(dst_list, src_list, by_index=True):
     """
     Merge arrays of dict objects by matching items in this order:
     1) Match by '_id'
     2) Match by 'name'
-    3) Fallback by index
+    3) Fallback by index (skipped when BY_INDEX is False)
+    Cross-key merges from merge_translations pass by_index=False, so they
+    only apply _id/name matches.
     Does not create or remove items — only updates existing ones.
     """
-    if not (isinstance(dst_list, list) and isinstance(src_list, list)):
+    _isinstance, _dict, _list, _str = isinstance, dict, list, str
+    if not (_isinstance(dst_list, _list) and _isinstance(src_list, _list)):
         return
 
-    dst_idx = [i for i, it in enumerate(dst_list) if isinstance(it, dict)]
-    src_idx = [i for i, it in enumerate(src_list) if isinstance(it, dict)]
+    dst_idx = [i for i, it in enumerate(dst_list) if _isinstance(it, _dict)]
 
-    by_id = {src_list[i].get("_id"): i for i in src_idx if isinstance(src_list[i].get("_id"), str)}
-    by_name = {src_list[i].get("name"): i for i in src_idx if isinstance(src_list[i].get("name"), str)}
+    by_id, by_name = {}, {}
+    for i, it in enumerate(src_list):
+        if not _isinstance(it, _dict):
+            continue
+        sid = it.get("_id")
+        if _isinstance(sid, _str):
+            by_id[sid] = i
+        nm = it.get("name")
+        if _isinstance(nm, _str):
+            by_name[nm] = i
 
     used_src = set()
 
     for di in dst_idx:
         d = dst_list[di]
         sid = d.get("_id")
-        if isinstance(sid, str) and sid in by_id:
+        if _isinstance(sid, _str) and sid in by_id:
             si = by_id[sid]
             if si not in used_src:
                 merge_translations(d, src_list[si])
@@ -146,16 +228,18 @@ def merge_lists(dst_list, src_list):
 
     for di in dst_idx:
         d = dst_list[di]
-        if not isinstance(d.get("name"), str):
+        if not _isinstance(d.get("name"), _str):
             continue
         si = by_name.get(d["name"])
         if si is not None and si not in used_src:
             merge_translations(d, src_list[si])
             used_src.add(si)
 
-    rem_dst = [di for di in dst_idx if isinstance(dst_list[di], dict)]
-    rem_src = [si for si in src_idx if si not in used_src]
-    for di, si in zip(rem_dst, rem_src):
+    if not by_index:
+        return
+
+    rem_src = [si for si, it in enumerate(src_list) if _isinstance(it, _dict) and si not in used_src]
+    for di, si in zip(dst_idx, rem_src):
         merge_translations(dst_list[di], src_list[si])
         used_src.add(si)
 # ----------------------------------
@@ -165,8 +249,7 @@ def sort_immediate_keys(data: Dict) -> Dict:
     """Sort only the first-level keys of a dict, keep values intact."""
     if not isinstance(data, dict):
         return data
-    sorted_items = sorted(data.items(), key=lambda item: item[0])
-    return OrderedDict(sorted_items)
+    return dict(sorted(data.items()))
 
 def partial_sort_json(data: Dict) -> Dict:
     """
@@ -174,7 +257,7 @@ def partial_sort_json(data: Dict) -> Dict:
     1) Keep top-level key order as TOP_LEVEL_KEYS_ORDER (when present).
     2) For 'folders' and 'entries', sort immediate inner keys only.
     """
-    sorted_data = OrderedDict()
+    sorted_data = {}
 
     for key in TOP_LEVEL_KEYS_ORDER:
         if key in data:
@@ -193,8 +276,11 @@ def partial_sort_json(data: Dict) -> Dict:
 def process_json_file_for_sort(json_file: Path):
     """Load, partially sort keys, and save a JSON file."""
     try:
-        with json_file.open(encoding="utf-8") as f:
-            data = json.load(f)
+        if is_up_to_date(json_file, "sort", json_file):
+            print(f"[sort] skip (up to date): {json_file.name}")
+            return
+
+        data = load_json(json_file)
 
         if isinstance(data, dict):
             sorted_data = partial_sort_json(data)
@@ -202,11 +288,19 @@ def process_json_file_for_sort(json_file: Path):
             print(f"[sort] skip (not a top-level JSON object): {json_file.name}")
             return
 
-        with json_file.open("w", encoding="utf-8") as f:
-            json_str = json.dumps(sorted_data, ensure_ascii=False, indent=2)
-            f.write(json_str)
+        reduced_path = json_file.with_name(json_file.stem + REDUCED_SUFFIX)
+        merge_current = reduced_path.exists() and is_up_to_date(json_file, "merge", json_file, reduced_path)
 
-        print(f"[sort] updated: {json_file.name}")
+        written = dump_json(sorted_data, json_file)
+        write_stamp(json_file, "sort", json_file)
+        if written and merge_current:
+            # Sorting does not touch translations, so the last merge still holds.
+            write_stamp(json_file, "merge", json_file, reduced_path)
+
+        if written:
+            print(f"[sort] updated: {json_file.name}")
+        else:
+            print(f"[sort] unchanged: {json_file.name}")
 
     except json.JSONDecodeError:
         print(f"[sort] invalid JSON: {json_file.name}")
@@ -215,6 +309,78 @@ def process_json_file_for_sort(json_file: Path):
 # ----------------------------------
 
 # ------------- I/O & CLI ----------
+class StdlibFloat(float):
+    """
+    A parsed float that orjson would write differently from json.dump:
+    exponent forms (1e+16, 1e-05) and NaN/Infinity. orjson refuses to encode
+    a float subclass, so files holding one are written by json.dump.
+    """
+
+def parse_json_float(text: str) -> float:
+    """Parse a JSON number with a fraction/exponent, tagging the ones orjson would reformat."""
+    value = float(text)
+    r = repr(value)
+    if "e" in r or "n" in r:
+        return StdlibFloat(value)
+    return value
+
+def load_json(path: Path):
+    """
+    Parse a JSON file with the stdlib parser, which keeps integers of any
+    width exact (orjson would silently turn them into floats).
+    """
+    with path.open(encoding="utf-8") as f:
+        return json.load(f, parse_float=parse_json_float, parse_constant=parse_json_float)
+
+def dump_json(data, path: Path) -> bool:
+    """
+    Write DATA as UTF-8 JSON indented by 2 spaces, using orjson when it is
+    available. Anything orjson cannot write exactly as json.dump would makes
+    it raise, and the stdlib encoder is used instead.
+    Leaves PATH untouched (mtime included) when it already holds the same
+    bytes; returns True if the file was written.
+    """
+    encoded = None
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # StdlibFloat values or integers beyond 64 bits
+    if encoded is None:
+        encoded = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+    try:
+        if path.stat().st_size == len(encoded) and path.read_bytes() == encoded:
+            return False
+    except FileNotFoundError:
+        pass
+    with path.open("wb") as f:
+        f.write(encoded)
+    return True
+
+def stamp_path(json_file: Path, mode: str) -> Path:
+    """Return the hidden sidecar that records the last MODE run on JSON_FILE."""
+    return json_file.with_name(f".{json_file.name}.{mode}{STAMP_SUFFIX}")
+
+def files_signature(*paths: Path) -> str:
+    """Describe the current state of PATHS by their mtime and size."""
+    parts = []
+    for p in paths:
+        st = p.stat()
+        parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+    return " ".join(parts)
+
+def is_up_to_date(json_file: Path, mode: str, *sources: Path) -> bool:
+    """Return True if SOURCES are unchanged since MODE last ran on JSON_FILE."""
+    try:
+        return stamp_path(json_file, mode).read_text(encoding="utf-8") == files_signature(*sources)
+    except OSError:
+        return False
+
+def write_stamp(json_file: Path, mode: str, *sources: Path):
+    """Record the current state of SOURCES after MODE ran on JSON_FILE."""
+    stamp_path(json_file, mode).write_text(files_signature(*sources), encoding="utf-8")
+
 def find_compendium_dir():
     """Locate the 'compendium/pt-BR' directory relative to this script."""
     here = Path(__file__).resolve().parent
@@ -224,92 +390,128 @@ def find_compendium_dir():
             return p
     return None
 
-def reduce_directory(compendium_dir: Path):
-    """Create *.reduced.json files with minimized translatable content."""
-    for json_file in compendium_dir.glob(JSON_GLOB):
-        if json_file.suffix != ".json" or json_file.name.endswith(REDUCED_SUFFIX):
-            continue
-        try:
-            with json_file.open(encoding="utf-8") as f:
-                data = json.load(f)
+def process_json_file_for_reduce(json_file: Path):
+    """Create the *.reduced.json file for a single JSON file."""
+    try:
+        data = load_json(json_file)
 
-            if not has_entries_nonempty(data):
-                print(f"[reduce] skip (no 'entries'): {json_file.name}")
-                continue
-            if not has_translatable_list(data):
-                print(f"[reduce] skip (no translatable list): {json_file.name}")
-                continue
+        reduced, changed, has_entries, has_translatable = reduce_and_check(data)
+        if not has_entries:
+            print(f"[reduce] skip (no 'entries'): {json_file.name}")
+            return
+        if not has_translatable:
+            print(f"[reduce] skip (no translatable list): {json_file.name}")
+            return
 
-            reduced = reduce_entries(deepcopy(data))
-            if has_reduction(data, reduced):
-                out_path = json_file.with_name(json_file.stem + REDUCED_SUFFIX)
-                with out_path.open("w", encoding="utf-8") as f:
-                    json.dump(reduced, f, ensure_ascii=False, indent=2)
-                print(f"[reduce] wrote: {out_path.name}")
-            else:
-                print(f"[reduce] no changes: {json_file.name}")
-        except Exception as e:
-            print(f"[reduce] error {json_file.name}: {e}")
+        if changed:
+            out_path = json_file.with_name(json_file.stem + REDUCED_SUFFIX)
+            dump_json(reduced, out_path)
+            print(f"[reduce] wrote: {out_path.name}")
+        else:
+            print(f"[reduce] no changes: {json_file.name}")
+    except Exception as e:
+        print(f"[reduce] error {json_file.name}: {e}")
 
-def merge_directory(compendium_dir: Path):
-    """Merge *.reduced.json translations into original JSON files."""
-    for json_file in compendium_dir.glob(JSON_GLOB):
-        if json_file.suffix != ".json" or json_file.name.endswith(REDUCED_SUFFIX):
-            continue
-        reduced_path = json_file.with_name(json_file.stem + REDUCED_SUFFIX)
-        if not reduced_path.exists():
-            continue
-        try:
-            with json_file.open(encoding="utf-8") as f:
-                original = json.load(f)
-            with reduced_path.open(encoding="utf-8") as f:
-                translated = json.load(f)
-
-            if isinstance(original, dict) and isinstance(translated, dict):
-                copy_string_fields(original, translated)
-
-                o_entries = original.get("entries")
-                t_entries = translated.get("entries")
-                if isinstance(o_entries, dict) and isinstance(t_entries, dict):
-                    t_by_key = {k: v for k, v in t_entries.items() if isinstance(v, dict)}
-                    t_by_inner_name = {}
-                    for tk, tv in t_entries.items():
-                        if isinstance(tv, dict):
-                            nm = tv.get("name")
-                            if isinstance(nm, str):
-                                t_by_inner_name[nm] = tv
-
-                    for key, o_val in o_entries.items():
-                        if not isinstance(o_val, dict):
-                            continue
-
-                        t_val = t_by_key.get(key)
-
-                        if t_val is None:
-                            oname = o_val.get("name")
-                            if isinstance(oname, str):
-                                t_val = t_by_key.get(oname)
-
-                        if t_val is None:
-                            oname = o_val.get("name")
-                            if isinstance(oname, str):
+def process_json_file_for_merge(json_file: Path):
+    """Merge the matching *.reduced.json translation into a single JSON file."""
+    reduced_path = json_file.with_name(json_file.stem + REDUCED_SUFFIX)
+    if not reduced_path.exists():
+        return
+    try:
+        if is_up_to_date(json_file, "merge", json_file, reduced_path):
+            print(f"[merge] skip (up to date): {json_file.name}")
+            return
+
+        original = load_json(json_file)
+        translated = load_json(reduced_path)
+
+        if isinstance(original, dict) and isinstance(translated, dict):
+            copy_string_fields(original, translated)
+
+            o_entries = original.get("entries")
+            t_entries = translated.get("entries")
+            if isinstance(o_entries, dict) and isinstance(t_entries, dict):
+                t_by_key = {}
+                t_by_inner_name = {}
+                for tk, tv in t_entries.items():
+                    if not isinstance(tv, dict):
+                        continue
+                    t_by_key[tk] = tv
+                    nm = tv.get("name")
+                    if isinstance(nm, str):
+                        t_by_inner_name[nm] = tv
+
+                for key, o_val in o_entries.items():
+                    if not isinstance(o_val, dict):
+                        continue
+
+                    t_val = t_by_key.get(key)
+
+                    if t_val is None:
+                        oname = o_val.get("name")
+                        if isinstance(oname, str):
+                            t_val = t_by_key.get(oname)
+                            if t_val is None:
                                 t_val = t_by_inner_name.get(oname)
 
-                        if isinstance(t_val, dict):
-                            merge_translations(o_val, t_val)
+                    if isinstance(t_val, dict):
+                        merge_translations(o_val, t_val)
 
-                    with json_file.open("w", encoding="utf-8") as f:
-                        json.dump(original, f, ensure_ascii=False, indent=2)
+                written = dump_json(original, json_file)
+                write_stamp(json_file, "merge", json_file, reduced_path)
+                if written:
                     print(f"[merge] updated: {json_file.name}")
                 else:
-                    print(f"[merge] skipped (no 'entries'): {json_file.name}")
-        except Exception as e:
-            print(f"[merge] error {json_file.name}: {e}")
+                    print(f"[merge] unchanged: {json_file.name}")
+            else:
+                print(f"[merge] skipped (no 'entries'): {json_file.name}")
+    except Exception as e:
+        print(f"[merge] error {json_file.name}: {e}")
+
+def iter_source_jsons(compendium_dir: Path):
+    """Yield the original *.json files in the directory (skip *.reduced.json)."""
+    with os.scandir(compendium_dir) as it:
+        for e in it:
+            if e.name.endswith(JSON_SUFFIX) and not e.name.endswith(REDUCED_SUFFIX) and e.is_file():
+                yield Path(e.path)
+
+def iter_reduced_jsons(compendium_dir: Path):
+    """Yield the *.reduced.json files in the directory."""
+    with os.scandir(compendium_dir) as it:
+        for e in it:
+            if e.name.endswith(REDUCED_SUFFIX) and e.is_file():
+                yield Path(e.path)
+
+def iter_merge_stamps(compendium_dir: Path):
+    """Yield the hidden .*.merge.stamp sidecars in the directory."""
+    suffix = f".merge{STAMP_SUFFIX}"
+    with os.scandir(compendium_dir) as it:
+        for e in it:
+            if e.name.startswith(".") and e.name.endswith(suffix) and e.is_file():
+                yield Path(e.path)
+
+def run_per_file(func, files):
+    """Run FUNC on every file in a process pool; files are processed independently."""
+    files = list(files)
+    if len(files) < 2:
+        for json_file in files:
+            func(json_file)
+        return
+    with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as ex:
+        list(ex.map(func, files, chunksize=4))
+
+def reduce_directory(compendium_dir: Path):
+    """Create *.reduced.json files with minimized translatable content."""
+    run_per_file(process_json_file_for_reduce, iter_source_jsons(compendium_dir))
+
+def merge_directory(compendium_dir: Path):
+    """Merge *.reduced.json translations into original JSON files."""
+    run_per_file(process_json_file_for_merge, iter_source_jsons(compendium_dir))
 
 def purge_reduced(compendium_dir: Path):
-    """Delete all *.reduced.json files in the compendium directory."""
+    """Delete all *.reduced.json files (and their merge stamps) in the compendium directory."""
     count = 0
-    for reduced_file in compendium_dir.glob(f"*{REDUCED_SUFFIX}"):
+    for reduced_file in list(iter_reduced_jsons(compendium_dir)) + list(iter_merge_stamps(compendium_dir)):
         try:
             reduced_file.unlink()
             count += 1
@@ -321,9 +523,7 @@ def purge_reduced(compendium_dir: Path):
 
 def sort_directory(compendium_dir: Path):
     """Partially sort keys for all JSON files (skip *.reduced.json)."""
-    for json_file in compendium_dir.glob(JSON_GLOB):
-        if json_file.suffix == ".json" and not json_file.name.endswith(REDUCED_SUFFIX):
-            process_json_file_for_sort(json_file)
+    run_per_file(process_json_file_for_sort, iter_source_jsons(compendium_dir))
 # ----------------------------------
 
 def main():